@@ -15,6 +15,9 @@ from .vscode import set_vscode_python_interpreter
 from .config import is_feature_disabled
 from .messaging import display_warning
 
+# Build tag most recently activated successfully by this process
+_CURRENT_BUILD_TAG = None
+
 
 def activate_or_build_and_activate_venv(build_tag):
     """
@@ -26,6 +29,11 @@ def activate_or_build_and_activate_venv(build_tag):
     Returns:
         bool: True if successful, False otherwise
     """
+    global _CURRENT_BUILD_TAG
+
+    # Repeat requests for the build this process already switched to are no-ops
+    if build_tag == _CURRENT_BUILD_TAG:
+        return True
 
     # Check if build switching is disabled at the entry point
     if is_feature_disabled("AUTO_BUILD_SWITCHER"):
@@ -52,6 +60,8 @@ def activate_or_build_and_activate_venv(build_tag):
                 ],
                 alignment="left",
             )
+        else:
+            _CURRENT_BUILD_TAG = build_tag
         return result
     # No venv
 
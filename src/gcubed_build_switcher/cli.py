@@ -1,6 +1,8 @@
 import sys
 import argparse
+import logging
 from . import activate_or_build_and_activate_venv
+from .config import get_log_level
 from .messaging import display_warning
 
 def main():
@@ -16,6 +18,9 @@ def main():
     )
     args = parser.parse_args()
 
+    # Diagnostic detail is logged at DEBUG; set GCUBED_LOG_LEVEL=DEBUG to see it
+    logging.basicConfig(level=get_log_level(), format="%(message)s")
+
     if activate_or_build_and_activate_venv(args.build_tag) is False:
         display_warning(
             [
@@ -1,6 +1,10 @@
+import functools
+import logging
 import os
 from typing import Optional, overload
 
+logger = logging.getLogger(__name__)
+
 
 @overload
 def get_optional_env_var(name: str) -> Optional[str]:
@@ -30,6 +34,9 @@ VENV_NAME_PREFIX = get_optional_env_var("GCUBED_VENV_NAME_PREFIX", "venv_gcubed_
 
 RICH_TRACEBACK_ENABLED = get_optional_env_var("RICH_TRACEBACKS")
 
+DEFAULT_LOG_LEVEL = "WARNING"
+LOG_LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 DEFAULT_PYTHON_INSTALL_ROOT = "~/.gcubed/python-builds/pyenv"
 DEFAULT_PYTHON_PREBUILT_MANIFEST_URL = (
     "https://github.com/McKibbin-Software-Group/gcubed-python-builds/releases/download/"
@@ -59,10 +66,12 @@ def get_required_env_var(name: str, error_message: Optional[str] = None) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=None)
 def is_feature_disabled(feature_name: str) -> bool:
     """
       The environment variable name is formatted as GCUBED_CODE_<feature_name>_DISABLED.
       The variable can have any value; it just has to exist to disable the feature.
+      The result is cached for the life of the process.
 
       Args:
         feature_name (str): The name of the feature to check.
@@ -71,28 +80,43 @@ def is_feature_disabled(feature_name: str) -> bool:
         bool: True if the feature is disabled, False otherwise.
     """
     environment_variable = f"GCUBED_CODE_{feature_name}_DISABLED"
-    print(f"Checking environment variable {environment_variable}")
     feature_is_disabled = os.environ.get(environment_variable) is not None
-    status = "disabled" if feature_is_disabled else "enabled"
-    print(f"Feature {feature_name} is {status}")
-    return bool(feature_is_disabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Checked environment variable %s: feature %s is %s",
+            environment_variable,
+            feature_name,
+            "disabled" if feature_is_disabled else "enabled",
+        )
+    return feature_is_disabled
 
 
+@functools.lru_cache(maxsize=None)
 def get_gcubed_root() -> str:
     """Get the G-Cubed root directory from environment."""
     return get_required_env_var("GCUBED_ROOT")
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_name() -> str:
     """Get the G-Cubed code package name."""
     return get_required_env_var("GCUBED_CODE_PACKAGE_NAME")
 
 
+@functools.lru_cache(maxsize=None)
 def get_prerequisites_repo_url() -> str:
     """Get the URL for the prerequisites repository."""
     return get_required_env_var("GCUBED_PYTHON_PREREQUISITES_REPO")
 
 
+def get_log_level() -> str:
+    """Get the logging level for diagnostic output from the CLI."""
+    level = get_optional_env_var("GCUBED_LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
+    if level not in LOG_LEVEL_NAMES:
+        return DEFAULT_LOG_LEVEL
+    return level
+
+
 def get_python_install_root() -> str:
     """Get the root directory for cached MSG Python builds."""
     configured_root = get_optional_env_var("GCUBED_PYTHON_INSTALL_ROOT")
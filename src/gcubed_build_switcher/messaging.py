@@ -1,6 +1,47 @@
+import functools
 import os
 import sys
 
+# Map color names to ANSI color codes
+ANSI_COLOR_CODES = {
+    "black": 0,
+    "red": 1,
+    "green": 2,
+    "yellow": 3,
+    "blue": 4,
+    "magenta": 5,
+    "cyan": 6,
+    "white": 7,
+}
+ANSI_RESET = "\033[0m"
+
+# Terminal color support cannot change during the process, so check it once
+_USE_COLOR = (
+    hasattr(sys.stdout, "isatty")
+    and sys.stdout.isatty()
+    and os.environ.get("NO_COLOR") is None
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_ansi_style(fg_color, bg_color):
+    """
+    Build the ANSI escape sequence for a foreground/background color pair.
+
+    Args:
+        fg_color (str): Foreground color name (unknown names default to white).
+        bg_color (str): Background color name (unknown names default to black).
+
+    Returns:
+        str: Escape sequence applying bold, foreground and background colors.
+    """
+    fg_code = ANSI_COLOR_CODES.get(fg_color.lower(), 7)  # Default to white
+    bg_code = ANSI_COLOR_CODES.get(bg_color.lower(), 0)  # Default to black
+
+    # Apply bold(1) + foreground(30+color) + background(40+color)
+    return f"\033[1;3{fg_code};4{bg_code}m"
+
+
 def format_styled_message(
     message,
     fg_color="yellow",
@@ -42,13 +83,14 @@ def format_styled_message(
 
     # Format lines with padding and alignment
     formatted_lines = [border_line, blank_line]
+    alignment = alignment.lower()
     for line in message:
-        if alignment.lower() == "left":
+        if alignment == "left":
             # Left align: padding on left, remaining space on right
             padded_line = (
                 f"{' ' * padding}{line}{' ' * (padded_width - len(line) - padding)}"
             )
-        elif alignment.lower() == "right":
+        elif alignment == "right":
             # Right align: remaining space on left, padding on right
             padded_line = (
                 f"{' ' * (padded_width - len(line) - padding)}{line}{' ' * padding}"
@@ -64,42 +106,19 @@ def format_styled_message(
 
     formatted_lines.extend([blank_line, border_line])
 
-    # Check if terminal supports color
-    use_color = (
-        hasattr(sys.stdout, "isatty")
-        and sys.stdout.isatty()
-        and os.environ.get("NO_COLOR") is None
-    )
-
-    if use_color:
-        # Map color names to ANSI color codes
-        color_map = {
-            "black": 0,
-            "red": 1,
-            "green": 2,
-            "yellow": 3,
-            "blue": 4,
-            "magenta": 5,
-            "cyan": 6,
-            "white": 7,
-        }
-
-        fg_code = color_map.get(fg_color.lower(), 7)  # Default to white
-        bg_code = color_map.get(bg_color.lower(), 0)  # Default to black
-
-        # Apply bold(1) + foreground(30+color) + background(40+color)
-        style = f"\033[1;3{fg_code};4{bg_code}m"
-        reset = "\033[0m"
-
-        return "\n".join(f"{style}{line}{reset}" for line in formatted_lines)
-    else:
+    if not _USE_COLOR:
         return "\n".join(formatted_lines)
 
+    style = get_ansi_style(fg_color, bg_color)
+    return "\n".join([style + line + ANSI_RESET for line in formatted_lines])
+
 
 def display_warning(message, **style_kwargs):
     """Display a formatted warning message with default styling."""
     if isinstance(message, str):
         message = [message]
+    if not message:
+        return
 
     styled_message = format_styled_message(
         message,
@@ -110,4 +129,8 @@ def display_warning(message, **style_kwargs):
         padding=style_kwargs.get("padding", 1),
         alignment=style_kwargs.get("alignment", "center")
     )
-    print(styled_message)
+
+    # One write for the whole banner, flushed so it is not interleaved with
+    # output from subprocesses sharing the terminal
+    sys.stdout.write(styled_message + "\n")
+    sys.stdout.flush()
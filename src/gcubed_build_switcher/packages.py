@@ -1,45 +1,63 @@
-import os
 import subprocess
 
-def install_packages(files, python_path, temp_dir_name, gcubed_root, config_param=None):
+def get_install_arguments(files, config_param=None):
     """
-    Install packages from wheel files or requirements files.
+    Build the `uv pip install` arguments for a list of files.
 
     Args:
         files (list): List of file paths to install
-        python_path (str): Path to the Python interpreter in the venv
-        temp_dir_name (str): Name of the temporary directory
-        gcubed_root (str): Root directory of the G-Cubed project
         config_param (str): Optional config parameter (e.g., '-r' for requirements files)
 
     Returns:
-        bool: True if installation succeeded, False otherwise
+        list: Arguments to append to the install command
     """
-    if not files:
-        return True
+    if config_param is None:
+        return list(files)
 
-    # Verify Python interpreter exists
-    if not os.path.exists(python_path):
-        print(f"Error: Python interpreter not found at {python_path}")
-        return False
+    arguments = []
+    for file_path in files:
+        arguments.extend([config_param, file_path])
 
-    file_type = "requirements" if config_param else "wheel"
-    print(f"Installing {file_type} files...")
+    return arguments
 
-    for file_path in files:
-        file_name = os.path.basename(file_path)
 
-        cmd = ["uv", "pip", "install", "-p", python_path]
+def install_packages(
+    wheel_files, requirements_files, python_path, gcubed_root, find_links_dir=None
+):
+    """
+    Install wheel files and requirements files with a single `uv pip install`,
+    so uv starts once and resolves the combined set of dependencies together.
 
-        if config_param is not None:
-            cmd.append(config_param)
+    Args:
+        wheel_files (list): List of wheel file paths to install
+        requirements_files (list): List of requirements file paths to install
+        python_path (str): Path to the Python interpreter in the venv
+        gcubed_root (str): Root directory of the G-Cubed project
+        find_links_dir (str): Optional directory holding wheels for every
+            dependency; when given, packages are resolved from it alone and
+            no package index is contacted
 
-        cmd.append( os.path.join(f"./{temp_dir_name}", file_name) )
+    Returns:
+        bool: True if installation succeeded, False otherwise
+    """
+    if not wheel_files and not requirements_files:
+        return True
 
-        try:
-            subprocess.run(cmd, cwd=gcubed_root, check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error installing {file_name}: {e}")
-            return False
+    print(
+        f"Installing {len(wheel_files)} wheel and "
+        f"{len(requirements_files)} requirements files..."
+    )
+
+    cmd = ["uv", "pip", "install", "-p", python_path]
+    if find_links_dir:
+        cmd.extend(["--no-index", "--find-links", find_links_dir])
+    cmd.extend(get_install_arguments(wheel_files))
+    cmd.extend(get_install_arguments(requirements_files, "-r"))
+
+    try:
+        subprocess.run(cmd, cwd=gcubed_root, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error installing packages: {e}")
+        return False
 
     return True
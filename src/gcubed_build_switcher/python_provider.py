@@ -1,17 +1,16 @@
 import errno
-import hashlib
 import json
 import os
 import platform
 import re
 import shutil
 import subprocess
-import tarfile
-import tempfile
 import time
-import urllib.request
 from typing import Optional
 
+# Download and archive modules (urllib.request, tarfile, hashlib, tempfile) are
+# imported inside the functions that use them, so importing the package stays
+# cheap when no Python needs to be installed.
 from .config import (
     DEFAULT_PYTHON_PROVIDER_ORDER,
     get_python_download_timeout_seconds,
@@ -297,6 +296,8 @@ def prebuilt_provider(version, install_root=None, state=None):
 
 
 def install_prebuilt_archive(version, install_root, archive, timeout_seconds):
+    import tempfile
+
     archive_url = archive.get("url")
     expected_sha256 = archive.get("sha256")
     archive_python = archive.get(
@@ -406,7 +407,7 @@ def install_prebuilt_archive(version, install_root, archive, timeout_seconds):
     finally:
         if archive_path and os.path.exists(archive_path):
             os.remove(archive_path)
-        if extract_dir and os.path.exists(extract_dir):
+        if extract_dir:
             shutil.rmtree(extract_dir, ignore_errors=True)
 
 
@@ -498,18 +499,24 @@ def get_python_validation_env():
 
 
 def fetch_json_url(url, timeout_seconds):
+    import urllib.request
+
     with urllib.request.urlopen(url, timeout=timeout_seconds) as response:
         payload = response.read()
     return json.loads(payload.decode("utf-8"))
 
 
 def download_url_to_file(url, destination, timeout_seconds):
+    import urllib.request
+
     with urllib.request.urlopen(url, timeout=timeout_seconds) as response:
         with open(destination, "wb") as f:
             shutil.copyfileobj(response, f)
 
 
 def sha256_file(path):
+    import hashlib
+
     digest = hashlib.sha256()
     with open(path, "rb") as f:
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
@@ -530,6 +537,8 @@ def find_manifest_archive(manifest, version, platform_id):
 
 
 def safe_extract_tar(archive_path, destination):
+    import tarfile
+
     with tarfile.open(archive_path, "r:gz") as tar:
         members = tar.getmembers()
         for member in members:
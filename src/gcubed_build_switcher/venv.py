@@ -1,9 +1,12 @@
+import functools
+import logging
+import mmap
 import os
+import re
 import sys
 import subprocess
 import shutil
-import glob
-from typing import Optional
+from typing import Dict, Optional
 
 from .config import (
     VENV_NAME_PREFIX,
@@ -18,7 +21,60 @@ from .config import (
 from .packages import install_packages
 from .python_provider import ensure_python_available, PythonProviderError
 
+logger = logging.getLogger(__name__)
+
+# Packages generated venvs need so model scripts can keep switching builds
+BUILD_SWITCHER_PACKAGE_NAME = "gcubed-build-switcher"
+RICH_PACKAGE_NAME = "rich"
+RUNTIME_SUPPORT_PACKAGES = (BUILD_SWITCHER_PACKAGE_NAME, RICH_PACKAGE_NAME)
+
+# Present in a prerequisites tag whose wheels cover every dependency, so the
+# install can skip the package index
+PREREQUISITE_OFFLINE_MARKER_FILE_NAME = "PREREQS_OFFLINE"
+
+# Prerequisites files needed to build a venv; everything else in the tagged
+# tree is left unfetched by the sparse clone. Wheels and requirements files are
+# matched at any depth so requirements can point into subdirectories
+PREREQUISITE_SPARSE_CHECKOUT_PATTERNS = (
+    "/.python-version",
+    "*.whl",
+    "*.txt",
+    f"/{PREREQUISITE_OFFLINE_MARKER_FILE_NAME}",
+)
+
+# Wire protocol v2 lets the server filter refs by prefix and honour partial
+# clone filters without advertising every ref; older gits default to v0
+GIT_PROTOCOL_V2_ARGS = ("-c", "protocol.version=2")
+
+# Executed by site.py at interpreter startup when Rich tracebacks are enabled.
+# site.py runs it before the base interpreter's site-packages is on sys.path,
+# so Rich must be installed in the venv itself; the guard keeps a venv without
+# it starting cleanly instead of printing an "Error processing line" traceback
+RICH_TRACEBACK_PTH_FILE_NAME = "zzz_gcubed_rich_traceback.pth"
+RICH_TRACEBACK_PTH_CONTENT = (
+    "import importlib.util; "
+    "importlib.util.find_spec('rich') is None or "
+    "__import__('rich.traceback').traceback.install(show_locals=False)\n"
+)
+
+# The exact lines older versions appended to sitecustomize.py, in order
+LEGACY_RICH_TRACEBACK_IMPORT_LINE = b"from rich.traceback import install"
+LEGACY_RICH_TRACEBACK_INSTALL_LINE = b"install(show_locals=False)"
+
+# Written into a venv after its G-Cubed package has been verified
+VENV_VERIFIED_MARKER_FILE_NAME = ".gcubed_verified"
+
+# Library directory name used by venvs of the running interpreter's version
+CURRENT_PYTHON_LIB_DIR_NAME = f"python{sys.version_info.major}.{sys.version_info.minor}"
+
+# Site-packages directory found for each venv path
+_SITE_PACKAGES_DIR_CACHE = {}  # type: Dict[str, str]
 
+# Venv path already verified and prepared by this process
+_PREPARED_VENV_PATH = None  # type: Optional[str]
+
+
+@functools.lru_cache(maxsize=32)
 def get_venv_name(gcubed_code_build_tag):
     """
     Construct virtual environment name from build tag.
@@ -88,11 +144,23 @@ def verify_venv_has_gcubed(venv_path: Optional[str]) -> bool:
     try:
         gcubed_package_name = get_package_name()
 
+        # Fastest path: nothing changed since the last successful verification
+        if venv_verified_marker_is_current(venv_path, gcubed_package_name):
+            return True
+
+        # Fast path: installed distribution metadata on disk, no subprocess
+        dist_info_dir = find_distribution_metadata_dir(venv_path, gcubed_package_name)
+        if dist_info_dir:
+            write_venv_verified_marker(venv_path, gcubed_package_name, dist_info_dir)
+            return True
+
+        # Fall back to uv for layouts without a matching .dist-info directory
         subprocess.run(
             ["uv", "pip", "show", "-p", python_path, gcubed_package_name],
             check=True,
             capture_output=True,
             text=True,
+            env=get_uv_env(),
         )
     except ConfigurationError as e:
         print(str(e))
@@ -109,12 +177,173 @@ def verify_venv_has_gcubed(venv_path: Optional[str]) -> bool:
     return True
 
 
+def find_venv_site_packages_dir(venv_path: str) -> Optional[str]:
+    """
+    Find the site-packages directory of a virtual environment.
+
+    Args:
+        venv_path (str): Path to the virtual environment
+
+    Returns:
+        str: Path to site-packages, or None if it cannot be found
+    """
+    site_packages_dir = _SITE_PACKAGES_DIR_CACHE.get(venv_path)
+    if site_packages_dir:
+        return site_packages_dir
+
+    # Most venvs share the running interpreter's version, so try that directly
+    site_packages_dir = os.path.join(
+        venv_path, "lib", CURRENT_PYTHON_LIB_DIR_NAME, "site-packages"
+    )
+    if os.path.isdir(site_packages_dir):
+        _SITE_PACKAGES_DIR_CACHE[venv_path] = site_packages_dir
+        return site_packages_dir
+
+    # Otherwise a single scan of <venv>/lib for python* directories
+    try:
+        with os.scandir(os.path.join(venv_path, "lib")) as entries:
+            python_lib_dirs = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith("python") and entry.is_dir()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None  # Not cached: the venv may be created later
+
+    for python_lib_dir in python_lib_dirs:
+        site_packages_dir = os.path.join(python_lib_dir, "site-packages")
+        if os.path.isdir(site_packages_dir):
+            _SITE_PACKAGES_DIR_CACHE[venv_path] = site_packages_dir
+            return site_packages_dir
+
+    return None
+
+
+def get_file_size(file_path: str) -> Optional[int]:
+    """Get a file's size with a single stat, or None if it does not exist."""
+    try:
+        return os.path.getsize(file_path)
+    except FileNotFoundError:
+        return None
+
+
+def normalize_distribution_name(distribution_name: str) -> str:
+    return re.sub(r"[-_.]+", "_", distribution_name).lower()
+
+
+def find_distribution_metadata_dir(
+    venv_path: str, distribution_name: str
+) -> Optional[str]:
+    """
+    Find the '<name>-<version>.dist-info' directory in the venv's site-packages.
+
+    Args:
+        venv_path (str): Path to the virtual environment
+        distribution_name (str): Name of the installed distribution
+
+    Returns:
+        str: Path to the matching .dist-info directory, or None if not found
+    """
+    site_packages_dir = find_venv_site_packages_dir(venv_path)
+    if not site_packages_dir:
+        return None
+
+    expected_name = normalize_distribution_name(distribution_name)
+    for entry_name in os.listdir(site_packages_dir):
+        if not entry_name.endswith(".dist-info"):
+            continue
+        installed_name = entry_name.split("-", 1)[0]
+        if normalize_distribution_name(installed_name) == expected_name:
+            return os.path.join(site_packages_dir, entry_name)
+    return None
+
+
+def venv_has_distribution_metadata(venv_path: str, distribution_name: str) -> bool:
+    """Check whether the venv's site-packages has metadata for the distribution."""
+    return find_distribution_metadata_dir(venv_path, distribution_name) is not None
+
+
+def get_venv_verified_marker_path(venv_path: str) -> str:
+    return os.path.join(venv_path, VENV_VERIFIED_MARKER_FILE_NAME)
+
+
+def get_venv_verified_marker_content(package_name: str, dist_info_dir: str) -> str:
+    dist_info_mtime_ns = os.stat(dist_info_dir).st_mtime_ns
+    return f"{package_name}\n{dist_info_dir}\n{dist_info_mtime_ns}"
+
+
+def venv_verified_marker_is_current(venv_path: str, package_name: str) -> bool:
+    """
+    Check the marker left by a previous successful verification.
+
+    The marker records the verified package's .dist-info directory and its
+    mtime, so reinstalling or removing the package invalidates it.
+
+    Args:
+        venv_path (str): Path to the virtual environment
+        package_name (str): Name of the G-Cubed code package
+
+    Returns:
+        bool: True if the marker still matches the installed package, False otherwise
+    """
+    try:
+        with open(get_venv_verified_marker_path(venv_path)) as f:
+            marker_content = f.read()
+        _marker_package_name, dist_info_dir, _mtime = marker_content.split("\n")
+        return marker_content == get_venv_verified_marker_content(
+            package_name, dist_info_dir
+        )
+    except (OSError, ValueError):
+        return False
+
+
+def write_venv_verified_marker(venv_path: str, package_name: str, dist_info_dir: str):
+    try:
+        with open(get_venv_verified_marker_path(venv_path), "w") as f:
+            f.write(get_venv_verified_marker_content(package_name, dist_info_dir))
+    except OSError:
+        pass  # The marker is only an optimization
+
+
+def forget_venv_state(venv_path: str):
+    """
+    Discard cached knowledge about a venv that is about to be (re)created.
+
+    Args:
+        venv_path (str): Path to the virtual environment
+    """
+    _SITE_PACKAGES_DIR_CACHE.pop(venv_path, None)
+    try:
+        os.remove(get_venv_verified_marker_path(venv_path))
+    except FileNotFoundError:
+        pass
+
+
+def file_contains(file_path: str, marker: bytes) -> bool:
+    """
+    Search a non-empty file for a byte marker using mmap, without reading the
+    file into Python objects.
+
+    Args:
+        file_path (str): Path to the file to search
+        marker (bytes): Byte sequence to look for
+
+    Returns:
+        bool: True if the marker occurs in the file, False otherwise
+    """
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            return mapped_file.find(marker) != -1
+
+
 def remove_directory_tree(directory_to_delete, message):
-    if os.path.exists(directory_to_delete):
-        print(message)
+    # Attempt the removal directly rather than stat-ing the tree first
+    try:
         shutil.rmtree(directory_to_delete)
-        return True
-    return False
+    except FileNotFoundError:
+        return False
+    print(message)
+    return True
 
 
 def get_uv_env():
@@ -123,6 +352,7 @@ def get_uv_env():
     return env
 
 
+@functools.lru_cache(maxsize=32)
 def get_venv_python_path(venv_path: str) -> str:
     return os.path.join(venv_path, "bin", "python")
 
@@ -147,17 +377,24 @@ def get_build_switcher_install_target() -> str:
 
 
 def venv_has_runtime_support_packages(python_path: str) -> bool:
+    venv_path = os.path.dirname(os.path.dirname(python_path))
+
+    # Rich must be in the venv itself: the Rich traceback .pth file runs before
+    # system site-packages is on sys.path, so a system copy is not enough
+    if not venv_has_distribution_metadata(venv_path, RICH_PACKAGE_NAME):
+        return False
+
+    # Fast path: distribution metadata in the venv itself, no subprocess
+    if all(
+        venv_has_distribution_metadata(venv_path, package_name)
+        for package_name in RUNTIME_SUPPORT_PACKAGES
+    ):
+        return True
+
+    # uv also sees packages provided through --system-site-packages
     try:
         subprocess.run(
-            [
-                "uv",
-                "pip",
-                "show",
-                "-p",
-                python_path,
-                "gcubed-build-switcher",
-                "rich",
-            ],
+            ["uv", "pip", "show", "-p", python_path, *RUNTIME_SUPPORT_PACKAGES],
             check=True,
             capture_output=True,
             text=True,
@@ -168,17 +405,31 @@ def venv_has_runtime_support_packages(python_path: str) -> bool:
         return False
 
 
-def ensure_runtime_support_packages(python_path: str, gcubed_root: str) -> bool:
+def ensure_runtime_support_packages(
+    python_path: str, gcubed_root: str, find_links_dir: Optional[str] = None
+) -> bool:
     """
     Ensure generated venvs can import the switcher after VS Code activates them.
 
     Build venvs may use an exact prebuilt Python that cannot see packages installed
     into the devcontainer's global Python, so install this support package directly.
+    Rich is installed alongside it so the Rich traceback .pth file can import it.
+
+    When find_links_dir is given, both packages are resolved from the wheels in
+    that directory alone, so it must ship them; the default git+https install
+    spec is replaced by the bare package name because it needs the network.
     """
     if venv_has_runtime_support_packages(python_path):
         return True
 
-    install_target = get_build_switcher_install_target()
+    cmd = ["uv", "pip", "install", "-p", python_path]
+    if find_links_dir:
+        cmd.extend(["--no-index", "--find-links", find_links_dir])
+        install_target = find_local_project_root() or BUILD_SWITCHER_PACKAGE_NAME
+    else:
+        install_target = get_build_switcher_install_target()
+    cmd.extend([RICH_PACKAGE_NAME, install_target])
+
     print(
         "Installing G-Cubed build switcher support package "
         "into virtual environment..."
@@ -186,7 +437,7 @@ def ensure_runtime_support_packages(python_path: str, gcubed_root: str) -> bool:
 
     try:
         subprocess.run(
-            ["uv", "pip", "install", "-p", python_path, install_target],
+            cmd,
             cwd=gcubed_root,
             check=True,
             env=get_uv_env(),
@@ -197,94 +448,171 @@ def ensure_runtime_support_packages(python_path: str, gcubed_root: str) -> bool:
         return False
 
 
+def remove_legacy_rich_sitecustomize(site_packages_dir):
+    """
+    Remove Rich traceback setup written into sitecustomize.py by older versions
+    of this package, which now use a dedicated .pth file instead.
+
+    Args:
+        site_packages_dir (str): Path to the venv's site-packages directory
+
+    Returns:
+        bool: True if legacy configuration was removed, False otherwise
+    """
+    customize_file = os.path.join(site_packages_dir, "sitecustomize.py")
+
+    # Only read and rewrite the file if our Rich configuration is present
+    if not get_file_size(customize_file):
+        return False
+    if not file_contains(customize_file, LEGACY_RICH_TRACEBACK_IMPORT_LINE):
+        return False
+
+    # Work in bytes so nothing is decoded or re-encoded
+    with open(customize_file, "rb") as f:
+        lines = f.read().splitlines()
+
+    # Remove only the import/install line pair we wrote, leaving any other
+    # Rich setup the user added themselves untouched
+    filtered_lines = []
+    index = 0
+    while index < len(lines):
+        if (
+            lines[index] == LEGACY_RICH_TRACEBACK_IMPORT_LINE
+            and index + 1 < len(lines)
+            and lines[index + 1] == LEGACY_RICH_TRACEBACK_INSTALL_LINE
+        ):
+            index += 2
+            continue
+        filtered_lines.append(lines[index])
+        index += 1
+
+    if len(filtered_lines) == len(lines):
+        return False
+
+    if any(filtered_lines):  # If anything remains, write it back atomically
+        customize_temp_file = f"{customize_file}.tmp"
+        with open(customize_temp_file, "wb") as f:
+            f.write(b"\n".join(filtered_lines))
+        os.replace(customize_temp_file, customize_file)
+    else:  # Empty file after removal
+        os.remove(customize_file)
+    return True
+
+
 def activate_rich_formatter(venv_path):
     """
     Configures Rich traceback handling for the virtual environment.
 
     When RICH_TRACEBACK_ENABLED is True, finds the appropriate site-packages
-    directory and creates/overwrites the sitecustomize.py file to install Rich
-    traceback formatter.
-    Otherwise, removes the file if it exists.
+    directory and creates a .pth file that site.py executes at startup to
+    install the Rich traceback formatter. Rich itself is installed into the
+    venv by ensure_runtime_support_packages.
+    Otherwise, removes that file if it exists.
 
     Args:
         venv_path (str): Path to the virtual environment
     """
 
-    print("Configuring Rich formatter...")
+    logger.debug("Configuring Rich formatter...")
 
     # Find the site-packages directory
-    site_packages_dirs = glob.glob(
-        os.path.join(venv_path, "lib", "python*", "site-packages")
-    )
+    site_packages_dir = find_venv_site_packages_dir(venv_path)
 
-    if not site_packages_dirs:
+    if not site_packages_dir:
         print(
             "Warning: Could not find site-packages directory in virtual "
             "environment - cannot activate Rich traceback formatter"
         )
         return
 
-    site_packages_dir = site_packages_dirs[0]  # Take the first match
-    customize_file = os.path.join(site_packages_dir, "sitecustomize.py")
+    pth_file = os.path.join(site_packages_dir, RICH_TRACEBACK_PTH_FILE_NAME)
 
-    if RICH_TRACEBACK_ENABLED:
-        # Check if file exists and contains our config already
-        existing_content = ""
+    # An older, unguarded .pth file differs in size and is rewritten. Legacy
+    # sitecustomize.py setup was removed when the current .pth was written
+    if RICH_TRACEBACK_ENABLED and (
+        get_file_size(pth_file) == len(RICH_TRACEBACK_PTH_CONTENT)
+    ):
+        logger.debug("Rich traceback formatter is enabled")
+        return  # Already configured
 
-        if os.path.exists(customize_file):
-            with open(customize_file, "r") as f:
-                existing_content = f.read()
+    removed_legacy_config = remove_legacy_rich_sitecustomize(site_packages_dir)
 
-            if "from rich.traceback import install" in existing_content:
-                print("Rich traceback formatter is enabled")
-                return  # Already configured
+    if RICH_TRACEBACK_ENABLED:
+        pth_temp_file = f"{pth_file}.tmp"
+        with open(pth_temp_file, "w") as f:
+            f.write(RICH_TRACEBACK_PTH_CONTENT)
+        os.replace(pth_temp_file, pth_file)
+        print("Rich traceback formatter has been enabled")
+        return
 
-            existing_content = existing_content.strip() + "\n\n"
+    try:
+        os.remove(pth_file)
+    except FileNotFoundError:
+        if not removed_legacy_config:
+            logger.debug("Rich traceback formatter is not enabled.")
+            return
+    print("Rich traceback formatter has been disabled.")
 
-        with open(customize_file, "w") as f:
-            f.write(
-                f"{existing_content}from rich.traceback import install\n"
-                "install(show_locals=False)"
-            )
-        print("Rich traceback formatter has been enabled")
 
-    elif os.path.exists(customize_file):
-        with open(customize_file, "r") as f:
-            lines = f.read().splitlines()
+def validate_build_tag(build_tag):
+    """
+    Validates if the specified build tag exists in the prerequisites repository.
+    Uses `git ls-remote`, so nothing is downloaded or written to disk.
 
-        # Look for and remove our Rich configuration
-        has_rich_config = False
-        filtered_lines = []
+    Args:
+        build_tag (str): The G-Cubed code build tag
 
-        for line in lines:
-            if "rich.traceback" in line or "show_locals" in line:
-                has_rich_config = True
-                continue  # Skip this line
-            filtered_lines.append(line)
+    Returns:
+        bool: True if the tag exists, False otherwise
+    """
+    try:
+        repo_url = get_prerequisites_repo_url()
 
-        if has_rich_config:  # Only take action if we found our config
-            if filtered_lines:  # If anything remains, write it back
-                with open(customize_file, "w") as f:
-                    f.write("\n".join(filtered_lines))
-            else:  # Empty file after removal
-                os.remove(customize_file)
-            print("Rich traceback formatter has been disabled.")
+        print(f"Validating build tag {build_tag}...")
+        subprocess.run(
+            [
+                "git",
+                *GIT_PROTOCOL_V2_ARGS,
+                "ls-remote",
+                "--tags",
+                "--exit-code",
+                repo_url,
+                f"refs/tags/{build_tag}",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return True
 
+    except ConfigurationError as e:
+        print(str(e))
+        return False
+    except subprocess.CalledProcessError as e:
+        # --exit-code makes ls-remote return 2 only when no matching ref exists
+        if e.returncode == 2:
+            print(
+                f"Error: Build tag '{build_tag}' does not exist in the "
+                "prerequisites repository."
+            )
         else:
-          print("Rich traceback formatter was not enabled in the first place.")
+            print(
+                f"Error: Could not check build tag '{build_tag}' in the "
+                "prerequisites repository:"
+            )
+            print((e.stderr or "").strip())
+        return False
 
-    else:
-        print("Rich traceback formatter is not enabled.")
 
-def validate_build_tag(build_tag):
+def clone_prerequisites_for_build(build_tag):
     """
-    Validates if the specified build tag exists in the prerequisites repository.
+    Shallow clones the prerequisites repository at the build tag into a temp directory.
 
     Args:
         build_tag (str): The G-Cubed code build tag
 
     Returns:
-        tuple: (bool, temp_dir_path) indicating success and path to temp clone
+        str: Path to the temp clone, or None if the clone failed
     """
     temp_dir_path = ""
     try:
@@ -298,13 +626,17 @@ def validate_build_tag(build_tag):
         # Remove temp directory if it already exists
         remove_directory_tree(temp_dir_path, "Removing old temp directory...")
 
-        # Clone the repository with the specific build tag
-        print(f"Validating build tag {build_tag}...")
+        # Clone the repository with the specific build tag, without checking
+        # out files, then check out only the prerequisites files
+        print(f"Fetching prerequisites for build tag {build_tag}...")
         clone_cmd = [
             "git",
+            *GIT_PROTOCOL_V2_ARGS,
             "clone",
             "--depth",
             "1",
+            "--filter=blob:none",
+            "--no-checkout",
             "--single-branch",
             "--branch",
             build_tag,
@@ -312,20 +644,66 @@ def validate_build_tag(build_tag):
             temp_dir_name,
         ]
         subprocess.run(clone_cmd, cwd=gcubed_root, check=True)
+        try:
+            subprocess.run(
+                [
+                    "git",
+                    "sparse-checkout",
+                    "set",
+                    "--no-cone",
+                    *PREREQUISITE_SPARSE_CHECKOUT_PATTERNS,
+                ],
+                cwd=temp_dir_path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            # `sparse-checkout set --no-cone` needs git 2.35 or later; older
+            # gits still work, they just check out the whole tagged tree
+            logger.debug(
+                "Sparse checkout unavailable, checking out full tree: %s",
+                (e.stderr or "").strip(),
+            )
+        subprocess.run(["git", "checkout"], cwd=temp_dir_path, check=True)
 
-        return True, temp_dir_path
+        return temp_dir_path
 
     except ConfigurationError as e:
         print(str(e))
-        return False, None
+        return None
     except subprocess.CalledProcessError:
         print(
-            f"Error: Build tag '{build_tag}' does not exist in the "
-            "prerequisites repository."
+            f"Error: Could not fetch prerequisites for build tag '{build_tag}'."
         )
         # Clean up temp directory if it was created
         remove_directory_tree(temp_dir_path, "Cleaning up temp directory")
-        return False, None
+        return None
+
+
+def find_prerequisite_files(prerequisites_path):
+    """
+    Find wheel files and requirements files in a prerequisites clone,
+    classifying entries in a single directory scan.
+
+    Args:
+        prerequisites_path (str): Path to the prerequisites clone
+
+    Returns:
+        tuple: (wheel_files, requirements_txt_files) as sorted lists of paths
+    """
+    wheel_files = []
+    requirements_txt_files = []
+    with os.scandir(prerequisites_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".whl"):
+                wheel_files.append(entry.path)
+            elif entry.name.startswith("requirements") and entry.name.endswith(".txt"):
+                requirements_txt_files.append(entry.path)
+
+    return sorted(wheel_files), sorted(requirements_txt_files)
 
 
 def create_venv_for_build(build_tag):
@@ -336,13 +714,15 @@ def create_venv_for_build(build_tag):
         build_tag (str): The G-Cubed code build tag
 
     Returns:
-        bool: True if creation successful, False otherwise
+        bool: True if the venv was created and verified, False otherwise
     """
-    # First validate the build tag
-    is_valid, temp_dir_path = validate_build_tag(build_tag)
-    if not is_valid:
+    # First validate the build tag, then fetch its prerequisites
+    if not validate_build_tag(build_tag):
+        return False
+
+    temp_dir_path = clone_prerequisites_for_build(build_tag)
+    if temp_dir_path is None:
         return False
-    assert temp_dir_path is not None
 
     venv_path = ""
     try:
@@ -359,13 +739,16 @@ def create_venv_for_build(build_tag):
             print(f".python-version file found - requesting version: {python_version}")
 
         print(f"Creating virtual environment for build {build_tag}...")
+        forget_venv_state(venv_path)
         venv_cmd = ["uv", "venv", "--system-site-packages", venv_name]
         if python_version:
             print(f"Resolving Python {python_version} (from .python-version)...")
             python_executable = ensure_python_available(python_version)
-            venv_cmd.extend(["--python", python_executable])
+            # The interpreter is an absolute path from python_provider, so uv
+            # has no reason to download a managed Python of its own
+            venv_cmd.extend(["--python", python_executable, "--no-python-downloads"])
         else:
-            print("No specific Python version requested")
+            logger.debug("No specific Python version requested")
 
         subprocess.run(venv_cmd, cwd=gcubed_root, check=True, env=get_uv_env())
 
@@ -373,35 +756,42 @@ def create_venv_for_build(build_tag):
         python_path = get_venv_python_path(venv_path)
 
         # Find files to install
-        wheel_files = glob.glob(os.path.join(temp_dir_path, "*.whl"))
-        requirements_txt_files = glob.glob(
-            os.path.join(temp_dir_path, "requirements*.txt")
-        )
+        wheel_files, requirements_txt_files = find_prerequisite_files(temp_dir_path)
+
+        # Resolve only from the shipped wheels if the tag says they are complete
+        find_links_dir = None
+        if os.path.exists(
+            os.path.join(temp_dir_path, PREREQUISITE_OFFLINE_MARKER_FILE_NAME)
+        ):
+            print("Offline prerequisites marker found - not using a package index")
+            find_links_dir = temp_dir_path
 
         # Install wheel files and requirements files
         if not install_packages(
             wheel_files,
+            requirements_txt_files,
             python_path,
-            get_venv_name(DEFAULT_TEMP_DIR_SUFFIX),
             gcubed_root,
+            find_links_dir,
         ):
-            raise RuntimeError(f"Failed to install wheel files for build {build_tag}")
+            raise RuntimeError(f"Failed to install packages for build {build_tag}")
 
-        if not install_packages(
-            requirements_txt_files,
+        if not ensure_runtime_support_packages(
             python_path,
-            get_venv_name(DEFAULT_TEMP_DIR_SUFFIX),
             gcubed_root,
-            "-r",
+            find_links_dir,
         ):
-            raise RuntimeError(f"Failed to install requirements for build {build_tag}")
-
-        if not ensure_runtime_support_packages(python_path, gcubed_root):
             raise RuntimeError(
                 "Failed to install build switcher support package for build "
                 f"{build_tag}"
             )
 
+        # Self-check, so callers can treat True as "created and verified"
+        if not verify_venv_has_gcubed(venv_path):
+            raise RuntimeError(
+                f"G-Cubed package missing after installing build {build_tag}"
+            )
+
         return True
 
     except PythonProviderError as e:
@@ -430,13 +820,33 @@ def prepare_local_venv(build_tag):
     Returns:
         bool: True if activation successful, False otherwise
     """
+    global _PREPARED_VENV_PATH
+
     venv_name = get_venv_name(build_tag)
     venv_path = try_get_venv_directory_for_build(venv_name)
     if venv_path is None:
         return False
 
+    # Nothing to do if this process has already prepared the venv
+    if venv_path == _PREPARED_VENV_PATH:
+        return True
+
+    # If this process is already running inside the requested venv, the
+    # switcher is evidently installed there, so only the cheap package check
+    # and the Rich toggle are needed
+    if (
+        os.environ.get("VIRTUAL_ENV") == venv_path
+        and sys.prefix == venv_path
+        and verify_venv_has_gcubed(venv_path)
+    ):
+        activate_rich_formatter(venv_path)
+        _PREPARED_VENV_PATH = venv_path
+        return True
+
     # Verify existing venv first
-    print(f"Verifying '{venv_name}' exists and has the gcubed module installed...")
+    logger.debug(
+        "Verifying '%s' exists and has the gcubed module installed...", venv_name
+    )
     result = verify_venv_has_gcubed(venv_path)
     if result:
         try:
@@ -453,18 +863,17 @@ def prepare_local_venv(build_tag):
 
         # If all good, then activate rich formatter
         activate_rich_formatter(venv_path)
+        _PREPARED_VENV_PATH = venv_path
         return True
 
     print("Something missing, re-creating...")
 
-    # Create the venv and install packages
+    # Create the venv and install packages (already verified on success)
     if create_venv_for_build(build_tag):
-        # Verify the newly created venv
-        print("Virtual environment created, verifying...")
-        result = verify_venv_has_gcubed(venv_path)
-        if result:
-            # If all good, then activate rich formatter
-            activate_rich_formatter(venv_path)
-            return True
+        print("Virtual environment created and verified.")
+        # If all good, then activate rich formatter
+        activate_rich_formatter(venv_path)
+        _PREPARED_VENV_PATH = venv_path
+        return True
 
     return False
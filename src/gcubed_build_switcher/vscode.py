@@ -1,13 +1,19 @@
-import os
 import json
 import socket
-from .venv import get_venv_name, try_get_venv_directory_for_build
+from .venv import (
+    get_venv_name,
+    get_venv_python_path,
+    try_get_venv_directory_for_build,
+)
 from .config import (
     VSCODE_VENV_SWITCHER_API_TIMEOUT_SECONDS,
     VSCODE_VENV_SOCKET_PATH,
     VSCODE_VENV_SWITCHER_API_ACTION,
 )
 
+# Large enough for the whole reply to arrive in a single recv_into call
+SOCKET_RECEIVE_BUFFER_SIZE = 65536
+
 
 def set_vscode_python_interpreter(build_tag):
     """
@@ -24,16 +30,10 @@ def set_vscode_python_interpreter(build_tag):
     if not full_path:
         return False
 
-    python_path = os.path.join(full_path, "bin", "python")
+    python_path = get_venv_python_path(full_path)
 
     print(f"Trying to switch python interpreter to: {python_path}")
 
-    # Check if socket file exists before attempting connection
-    if not os.path.exists(VSCODE_VENV_SOCKET_PATH):
-        print(f"Socket file not found at {VSCODE_VENV_SOCKET_PATH}")
-        print("Is the VS Code extension installed and running?")
-        return False
-
     try:
         # Prepare the request payload
         payload = {
@@ -42,7 +42,7 @@ def set_vscode_python_interpreter(build_tag):
             "shortName": venv_name,
         }
 
-        # Create and connect the socket
+        # Create and connect the socket (a missing socket file raises FileNotFoundError)
         client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         client.settimeout(VSCODE_VENV_SWITCHER_API_TIMEOUT_SECONDS)
         client.connect(VSCODE_VENV_SOCKET_PATH)
@@ -51,21 +51,23 @@ def set_vscode_python_interpreter(build_tag):
         message = json.dumps(payload).encode("utf-8") + b"\0"
         client.sendall(message)
 
-        # Read the response until NULL_BYTE
-        response_data = b""
+        # Read the response until NULL_BYTE into a reusable buffer
+        response_data = bytearray()
+        receive_buffer = bytearray(SOCKET_RECEIVE_BUFFER_SIZE)
+        receive_view = memoryview(receive_buffer)
         while True:
-            chunk = client.recv(1024)
-            if not chunk:
+            received = client.recv_into(receive_view)
+            if not received:
                 break
 
-            # Check if chunk contains NULL_BYTE
-            if 0 in chunk:
-                # Find position and slice off after NULL_BYTE
-                null_pos = chunk.find(0)
-                response_data += chunk[:null_pos]
+            # Check only the newly received bytes for NULL_BYTE
+            null_pos = receive_buffer.find(0, 0, received)
+            if null_pos != -1:
+                # Keep everything before NULL_BYTE
+                response_data += receive_view[:null_pos]
                 break
 
-            response_data += chunk
+            response_data += receive_view[:received]
 
         # Parse response and determine success
         responseString = response_data.decode("utf-8")
@@ -82,6 +84,10 @@ def set_vscode_python_interpreter(build_tag):
             )
             return False
 
+    except FileNotFoundError:
+        print(f"Socket file not found at {VSCODE_VENV_SOCKET_PATH}")
+        print("Is the VS Code extension installed and running?")
+        return False
     except socket.timeout:
         print(
             f"Connection to VS Code extension timed out after {VSCODE_VENV_SWITCHER_API_TIMEOUT_SECONDS} seconds"
@@ -3,6 +3,7 @@ import io
 import json
 import os
 import stat
+import subprocess
 import sys
 import tarfile
 import tempfile
@@ -18,6 +19,7 @@ if SRC_ROOT not in sys.path:
 
 from gcubed_build_switcher import python_provider
 from gcubed_build_switcher import config
+from gcubed_build_switcher import packages
 from gcubed_build_switcher import venv as switcher_venv
 
 
@@ -411,7 +413,10 @@ class PythonProviderTests(unittest.TestCase):
 
             with mock.patch(
                 "gcubed_build_switcher.venv.validate_build_tag",
-                return_value=(True, temp_dir),
+                return_value=True,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.clone_prerequisites_for_build",
+                return_value=temp_dir,
             ), mock.patch(
                 "gcubed_build_switcher.venv.get_gcubed_root",
                 return_value=gcubed_root,
@@ -424,6 +429,9 @@ class PythonProviderTests(unittest.TestCase):
             ), mock.patch(
                 "gcubed_build_switcher.venv.ensure_runtime_support_packages",
                 return_value=True,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.verify_venv_has_gcubed",
+                return_value=True,
             ), mock.patch(
                 "gcubed_build_switcher.venv.subprocess.run",
                 side_effect=fake_run,
@@ -446,6 +454,7 @@ class PythonProviderTests(unittest.TestCase):
                 venv_command[venv_command.index("--python") + 1],
                 "/tmp/gcubed-python",
             )
+            self.assertIn("--no-python-downloads", venv_command)
             self.assertEqual(venv_env["UV_LINK_MODE"], "copy")
             self.assertFalse(
                 any(
@@ -454,31 +463,155 @@ class PythonProviderTests(unittest.TestCase):
                 )
             )
 
+    def test_validate_build_tag_reports_missing_tag_and_git_errors(self):
+        cases = [
+            (2, "", "does not exist"),
+            (128, "fatal: Authentication failed\n", "fatal: Authentication failed"),
+        ]
+        for returncode, stderr, expected in cases:
+            error = subprocess.CalledProcessError(
+                returncode, ["git", "ls-remote"], stderr=stderr
+            )
+            output = io.StringIO()
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.get_prerequisites_repo_url",
+                return_value="https://example.invalid/prereqs.git",
+            ), mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+                side_effect=error,
+            ), mock.patch(
+                "sys.stdout",
+                new=output,
+            ):
+                self.assertFalse(switcher_venv.validate_build_tag("c_0001"))
+
+            self.assertIn(expected, output.getvalue())
+            if returncode != 2:
+                self.assertNotIn("does not exist", output.getvalue())
+
+    def test_prerequisites_clone_falls_back_to_full_checkout(self):
+        commands = []
+
+        def fake_run(cmd, **_kwargs):
+            commands.append(cmd)
+            if cmd[:2] == ["git", "sparse-checkout"]:
+                raise subprocess.CalledProcessError(
+                    129, cmd, stderr="error: unknown option `no-cone'"
+                )
+            return mock.Mock(returncode=0)
+
+        with tempfile.TemporaryDirectory() as gcubed_root:
+            with mock.patch(
+                "gcubed_build_switcher.venv.get_gcubed_root",
+                return_value=gcubed_root,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.get_prerequisites_repo_url",
+                return_value="https://example.invalid/prereqs.git",
+            ), mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+                side_effect=fake_run,
+            ), mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                clone_path = switcher_venv.clone_prerequisites_for_build("c_0001")
+
+        self.assertIsNotNone(clone_path)
+        self.assertEqual(commands[-1], ["git", "checkout"])
+
+    def test_install_packages_uses_single_uv_invocation(self):
+        with tempfile.TemporaryDirectory() as gcubed_root:
+            python_path = create_fake_python(
+                os.path.join(gcubed_root, "venv", "bin", "python"),
+                "3.13.11",
+            )
+            temp_dir = os.path.join(gcubed_root, "temp")
+
+            with mock.patch(
+                "gcubed_build_switcher.packages.subprocess.run",
+            ) as run, mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                result = packages.install_packages(
+                    [os.path.join(temp_dir, "a.whl"), os.path.join(temp_dir, "b.whl")],
+                    [os.path.join(temp_dir, "requirements.txt")],
+                    python_path,
+                    gcubed_root,
+                )
+
+        self.assertTrue(result)
+        run.assert_called_once()
+        self.assertEqual(
+            run.call_args[0][0],
+            [
+                "uv", "pip", "install", "-p", python_path,
+                os.path.join(temp_dir, "a.whl"),
+                os.path.join(temp_dir, "b.whl"),
+                "-r", os.path.join(temp_dir, "requirements.txt"),
+            ],
+        )
+
+    def test_install_packages_skips_index_with_find_links_dir(self):
+        with tempfile.TemporaryDirectory() as gcubed_root:
+            python_path = os.path.join(gcubed_root, "venv", "bin", "python")
+            temp_dir = os.path.join(gcubed_root, "temp")
+
+            with mock.patch(
+                "gcubed_build_switcher.packages.subprocess.run",
+            ) as run, mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                result = packages.install_packages(
+                    [os.path.join(temp_dir, "a.whl")],
+                    [os.path.join(temp_dir, "requirements.txt")],
+                    python_path,
+                    gcubed_root,
+                    temp_dir,
+                )
+
+        self.assertTrue(result)
+        self.assertEqual(
+            run.call_args[0][0],
+            [
+                "uv", "pip", "install", "-p", python_path,
+                "--no-index", "--find-links", temp_dir,
+                os.path.join(temp_dir, "a.whl"),
+                "-r", os.path.join(temp_dir, "requirements.txt"),
+            ],
+        )
+
     def test_runtime_support_install_installs_switcher_when_missing(self):
         commands = []
         show_calls = []
 
-        def fake_run(cmd, cwd=None, check=False, **_kwargs):
-            commands.append((cmd, cwd, check))
-            if cmd[:4] == ["uv", "pip", "show", "-p"]:
-                show_calls.append(cmd)
-                if len(show_calls) == 1:
-                    raise switcher_venv.subprocess.CalledProcessError(1, cmd)
-
-        with mock.patch(
-            "gcubed_build_switcher.venv.subprocess.run",
-            side_effect=fake_run,
-        ), mock.patch(
-            "gcubed_build_switcher.venv.get_build_switcher_install_target",
-            return_value="gcubed-build-switcher-test-spec",
-        ), mock.patch(
-            "sys.stdout",
-            new=io.StringIO(),
-        ):
-            result = switcher_venv.ensure_runtime_support_packages(
-                "/tmp/venv/bin/python",
-                "/tmp/gcubed-root",
-            )
+        with tempfile.TemporaryDirectory() as venv_path:
+            site_packages = os.path.join(venv_path, "lib", "python3.13", "site-packages")
+            os.makedirs(os.path.join(site_packages, "rich-14.0.0.dist-info"))
+
+            def fake_run(cmd, cwd=None, check=False, **_kwargs):
+                commands.append((cmd, cwd, check))
+                if cmd[:4] == ["uv", "pip", "show", "-p"]:
+                    show_calls.append(cmd)
+                    if len(show_calls) == 1:
+                        raise switcher_venv.subprocess.CalledProcessError(1, cmd)
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+                side_effect=fake_run,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.get_build_switcher_install_target",
+                return_value="gcubed-build-switcher-test-spec",
+            ), mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                result = switcher_venv.ensure_runtime_support_packages(
+                    os.path.join(venv_path, "bin", "python"),
+                    "/tmp/gcubed-root",
+                )
 
         self.assertTrue(result)
         install_commands = [
@@ -489,6 +622,185 @@ class PythonProviderTests(unittest.TestCase):
         self.assertEqual(len(install_commands), 1)
         self.assertEqual(install_commands[0][-1], "gcubed-build-switcher-test-spec")
 
+    def test_runtime_support_install_uses_find_links_dir_offline(self):
+        with tempfile.TemporaryDirectory() as venv_path:
+            with mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+            ) as run, mock.patch(
+                "gcubed_build_switcher.venv.venv_has_runtime_support_packages",
+                side_effect=[False, True],
+            ), mock.patch(
+                "gcubed_build_switcher.venv.find_local_project_root",
+                return_value=None,
+            ), mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                result = switcher_venv.ensure_runtime_support_packages(
+                    os.path.join(venv_path, "bin", "python"),
+                    "/tmp/gcubed-root",
+                    "/tmp/prereqs",
+                )
+
+        self.assertTrue(result)
+        self.assertEqual(
+            run.call_args[0][0][5:],
+            [
+                "--no-index", "--find-links", "/tmp/prereqs",
+                "rich", "gcubed-build-switcher",
+            ],
+        )
+
+    def test_runtime_support_requires_rich_in_venv_not_system_site_packages(self):
+        commands = []
+
+        with tempfile.TemporaryDirectory() as venv_path:
+            # Rich only visible through --system-site-packages, not in the venv
+            site_packages = os.path.join(venv_path, "lib", "python3.13", "site-packages")
+            os.makedirs(os.path.join(site_packages, "gcubed_build_switcher-1.0.dist-info"))
+            python_path = os.path.join(venv_path, "bin", "python")
+
+            def fake_run(cmd, **_kwargs):
+                # uv reports both packages as present, as it would for a system copy
+                commands.append(cmd)
+                if cmd[:3] == ["uv", "pip", "install"]:
+                    os.makedirs(os.path.join(site_packages, "rich-14.0.0.dist-info"))
+                return mock.Mock(returncode=0)
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+                side_effect=fake_run,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.get_build_switcher_install_target",
+                return_value="gcubed-build-switcher-test-spec",
+            ), mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                has_support_before = switcher_venv.venv_has_runtime_support_packages(
+                    python_path
+                )
+                result = switcher_venv.ensure_runtime_support_packages(
+                    python_path,
+                    "/tmp/gcubed-root",
+                )
+
+        self.assertFalse(has_support_before)
+        self.assertTrue(result)
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(commands[0][:3], ["uv", "pip", "install"])
+        self.assertIn("rich", commands[0])
+
+    def test_verify_venv_uses_dist_info_without_subprocess(self):
+        with tempfile.TemporaryDirectory() as venv_path:
+            create_fake_python(os.path.join(venv_path, "bin", "python"), "3.13.11")
+            dist_info_dir = os.path.join(
+                venv_path,
+                "lib",
+                "python3.13",
+                "site-packages",
+                "GCubed_Code-2.0.1.dist-info",
+            )
+            os.makedirs(dist_info_dir)
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.get_package_name",
+                return_value="gcubed-code",
+            ), mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+            ) as run:
+                result = switcher_venv.verify_venv_has_gcubed(venv_path)
+                marker_is_current = switcher_venv.venv_verified_marker_is_current(
+                    venv_path,
+                    "gcubed-code",
+                )
+                os.rmdir(dist_info_dir)
+                marker_is_stale = not switcher_venv.venv_verified_marker_is_current(
+                    venv_path,
+                    "gcubed-code",
+                )
+
+            self.assertTrue(result)
+            self.assertTrue(marker_is_current)
+            self.assertTrue(marker_is_stale)
+            run.assert_not_called()
+
+    def test_runtime_support_check_uses_dist_info_without_subprocess(self):
+        with tempfile.TemporaryDirectory() as venv_path:
+            site_packages = os.path.join(venv_path, "lib", "python3.13", "site-packages")
+            for dist_info in ("gcubed_build_switcher-1.1.4.dist-info", "rich-13.9.4.dist-info"):
+                os.makedirs(os.path.join(site_packages, dist_info))
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+            ) as run:
+                result = switcher_venv.venv_has_runtime_support_packages(
+                    os.path.join(venv_path, "bin", "python"),
+                )
+
+            self.assertTrue(result)
+            run.assert_not_called()
+
+    def test_rich_formatter_uses_pth_file_and_removes_legacy_sitecustomize(self):
+        with tempfile.TemporaryDirectory() as venv_path:
+            site_packages = os.path.join(venv_path, "lib", "python3.13", "site-packages")
+            os.makedirs(os.path.join(site_packages, "rich-14.0.0.dist-info"))
+            customize_file = os.path.join(site_packages, "sitecustomize.py")
+            pth_file = os.path.join(
+                site_packages,
+                switcher_venv.RICH_TRACEBACK_PTH_FILE_NAME,
+            )
+            with open(customize_file, "w") as f:
+                f.write(
+                    "import user_setup\n"
+                    "user_setup.configure(show_locals=True)\n\n"
+                    "from rich.traceback import install\n"
+                    "install(show_locals=False)"
+                )
+
+            with mock.patch("sys.stdout", new=io.StringIO()), mock.patch(
+                "gcubed_build_switcher.venv.subprocess.run",
+            ) as run:
+                with mock.patch(
+                    "gcubed_build_switcher.venv.RICH_TRACEBACK_ENABLED",
+                    "1",
+                ):
+                    switcher_venv.activate_rich_formatter(venv_path)
+                    switcher_venv.activate_rich_formatter(venv_path)
+                with open(customize_file) as f:
+                    customize_content = f.read()
+                with open(pth_file) as f:
+                    pth_content = f.read()
+
+                with mock.patch(
+                    "gcubed_build_switcher.venv.RICH_TRACEBACK_ENABLED",
+                    None,
+                ):
+                    switcher_venv.activate_rich_formatter(venv_path)
+                pth_removed = not os.path.exists(pth_file)
+
+        self.assertEqual(
+            customize_content,
+            "import user_setup\nuser_setup.configure(show_locals=True)\n",
+        )
+        self.assertEqual(pth_content, switcher_venv.RICH_TRACEBACK_PTH_CONTENT)
+        self.assertTrue(pth_removed)
+        run.assert_not_called()
+
+    def test_rich_traceback_pth_line_skips_missing_rich(self):
+        fake_rich = mock.Mock()
+        with mock.patch.dict(
+            sys.modules,
+            {"rich": fake_rich, "rich.traceback": fake_rich.traceback},
+        ):
+            with mock.patch("importlib.util.find_spec", return_value=None):
+                exec(switcher_venv.RICH_TRACEBACK_PTH_CONTENT, {})
+            fake_rich.traceback.install.assert_not_called()
+
+            with mock.patch("importlib.util.find_spec", return_value=mock.Mock()):
+                exec(switcher_venv.RICH_TRACEBACK_PTH_CONTENT, {})
+            fake_rich.traceback.install.assert_called_once_with(show_locals=False)
+
     def test_prepare_existing_venv_repairs_runtime_support_before_activation(self):
         with tempfile.TemporaryDirectory() as gcubed_root:
             venv_path = os.path.join(gcubed_root, "venv_gcubed_build-tag")
@@ -521,6 +833,66 @@ class PythonProviderTests(unittest.TestCase):
             )
             activate_rich.assert_called_once_with(venv_path)
 
+    def test_prepare_venv_is_memoized_within_process(self):
+        with tempfile.TemporaryDirectory() as gcubed_root:
+            venv_path = os.path.join(gcubed_root, "venv_gcubed_memo-tag")
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.try_get_venv_directory_for_build",
+                return_value=venv_path,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.verify_venv_has_gcubed",
+                return_value=True,
+            ) as verify, mock.patch(
+                "gcubed_build_switcher.venv.get_gcubed_root",
+                return_value=gcubed_root,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.ensure_runtime_support_packages",
+                return_value=True,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.activate_rich_formatter",
+            ), mock.patch(
+                "gcubed_build_switcher.venv._PREPARED_VENV_PATH",
+                None,
+            ), mock.patch(
+                "sys.stdout",
+                new=io.StringIO(),
+            ):
+                self.assertTrue(switcher_venv.prepare_local_venv("memo-tag"))
+                self.assertTrue(switcher_venv.prepare_local_venv("memo-tag"))
+
+            verify.assert_called_once_with(venv_path)
+
+    def test_prepare_venv_skips_runtime_support_inside_requested_venv(self):
+        with tempfile.TemporaryDirectory() as gcubed_root:
+            venv_path = os.path.join(gcubed_root, "venv_gcubed_active-tag")
+
+            with mock.patch(
+                "gcubed_build_switcher.venv.try_get_venv_directory_for_build",
+                return_value=venv_path,
+            ), mock.patch(
+                "gcubed_build_switcher.venv.verify_venv_has_gcubed",
+                return_value=True,
+            ) as verify, mock.patch(
+                "gcubed_build_switcher.venv.ensure_runtime_support_packages",
+            ) as ensure_support, mock.patch(
+                "gcubed_build_switcher.venv.activate_rich_formatter",
+            ) as activate_rich, mock.patch(
+                "gcubed_build_switcher.venv._PREPARED_VENV_PATH",
+                None,
+            ), mock.patch.dict(
+                os.environ,
+                {"VIRTUAL_ENV": venv_path},
+            ), mock.patch(
+                "gcubed_build_switcher.venv.sys.prefix",
+                venv_path,
+            ):
+                self.assertTrue(switcher_venv.prepare_local_venv("active-tag"))
+
+            verify.assert_called_once_with(venv_path)
+            activate_rich.assert_called_once_with(venv_path)
+            ensure_support.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()